@@ -3,46 +3,124 @@ from textual.widgets import Button, Footer, Header, Static, Digits, Input, Label
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from time import monotonic
+from typing import Optional
 from textual import on
 
+# Common input values, parsed once
+_D = {str(i): i for i in range(1000)}
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """Parse a non-negative integer input, or return None if invalid."""
+    n = _D.get(value)
+    if n is not None:
+        return n
+    if value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
+# Preformatted digit tables: "00".."99" and "00.00".."59.99"
+_TD = [f"{i:02}" for i in range(100)]
+_SS = [f"{i // 100:02}.{i % 100:02}" for i in range(6000)]
+
+
+def _fmt(cs: int) -> str:
+    """Format a centisecond count as HH:MM:SS.ss."""
+    hours, rem = divmod(cs, 360000)
+    minutes, rem = divmod(rem, 6000)
+    if hours < 100:
+        return _TD[hours] + ":" + _TD[minutes] + ":" + _SS[rem]
+    return f"{hours}:" + _TD[minutes] + ":" + _SS[rem]
+
+
 # Timer display (counts down)
 class TimeDisplay(Digits):
-    start_time = reactive(monotonic)
-    time = reactive(0.0)  # elapsed time
-    total = reactive(0.0)  # accumulated elapsed
-    limit = reactive(0.0)  # seconds
-    session_type = reactive("study")  # "study" or "break"
+    time_cs = reactive(0)  # elapsed time, centiseconds
 
-    def on_mount(self) -> None:
-        self.update_timer = self.set_interval(1/60, self.update_time, pause=True)
+    _last_cs = -1  # last centisecond value pushed to the display
+    _last_new_cs = -1  # last elapsed centisecond value written to time_cs
+
+    _handle = None  # pending one-shot Timer for the next tick
+    _ticking = False
+    _MIN_STEP = 1/30  # tick no faster than 30 Hz, under Textual's 60 fps paint cap
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Plain attributes: nothing watches these, so skip reactive dispatch
+        self.start_cs = int(monotonic() * 100)
+        self.total_cs = 0  # accumulated elapsed, centiseconds
+        self._limit_cs = 0  # limit in integer centiseconds
+        self._has_limit = False
+        self.session_type = "study"  # "study" or "break"
+
+    def _schedule(self, now: float) -> None:
+        # start_cs sits on the clock's centisecond grid, so wake on the first
+        # centisecond boundary of monotonic() at least _MIN_STEP away
+        delay = self._MIN_STEP + 0.01 - ((now + self._MIN_STEP) % 0.01)
+        self._handle = self.set_timer(delay, self._tick)
 
-    def update_time(self) -> None:
-        new_time = self.total + (monotonic() - self.start_time)
-        if self.limit > 0 and new_time >= self.limit:
-            self.time = self.limit
-            self.stop()
+    def _tick(self) -> None:
+        self._handle = None
+        now = monotonic()
+        self.update_time(now)
+        if self._ticking:
+            self._schedule(now)
+
+    def update_time(self, now: float) -> None:
+        new_cs = self.total_cs + int(now * 100) - self.start_cs
+        if self._has_limit and new_cs >= self._limit_cs:
+            self.time_cs = self._limit_cs
+            self.stop(now)
             self.on_limit_reached()
-        else:
-            self.time = new_time
+            return
+        # Skip the reactive dispatch when nothing visible changed
+        if new_cs == self._last_new_cs:
+            return
+        self._last_new_cs = new_cs
+        self.time_cs = new_cs
+
+    def watch_time_cs(self, time_cs: int) -> None:
+        cs = max(self._limit_cs - time_cs, 0)
+        if cs == self._last_cs:
+            return
+        self._last_cs = cs
+        self.update(_fmt(cs))
+
+    def set_limit(self, seconds: int) -> None:
+        """Set the session length, precomputing the per-tick comparison."""
+        self._limit_cs = int(seconds * 100)
+        self._has_limit = seconds > 0
 
-    def watch_time(self, time: float) -> None:
-        remaining = max(self.limit - time, 0)
-        minutes, seconds = divmod(remaining, 60)
-        hours, minutes = divmod(minutes, 60)
-        self.update(f"{int(hours):02}:{int(minutes):02}:{seconds:05.2f}")
+    def set_session_style(self, session_type: Optional[str]) -> None:
+        """Colour the display via CSS classes; None clears it."""
+        self.set_class(session_type == "study", "study")
+        self.set_class(session_type == "break", "break")
 
     def start(self) -> None:
-        self.start_time = monotonic()
-        self.update_timer.resume()
+        now = monotonic()
+        self.start_cs = int(now * 100)
+        self._ticking = True
+        if self._handle is not None:
+            self._handle.stop()
+        self._schedule(now)
 
-    def stop(self):
-        self.update_timer.pause()
-        self.total += monotonic() - self.start_time
-        self.time = self.total
+    def stop(self, now: Optional[float] = None):
+        if not self._ticking:
+            return
+        # Read the clock before cancelling so the pause lands where it was asked for
+        if now is None:
+            now = monotonic()
+        self._ticking = False
+        if self._handle is not None:
+            self._handle.stop()
+            self._handle = None
+        self.total_cs += int(now * 100) - self.start_cs
+        self.time_cs = self.total_cs
 
     def reset(self):
-        self.total = 0
-        self.time = 0
+        self.total_cs = 0
+        self._last_new_cs = -1
+        self.time_cs = 0
 
     def on_limit_reached(self) -> None:
         self.app.bell()
@@ -58,15 +136,19 @@ class SessionEnded(Message):
 
 # Editable wrapper and Pomodoro
 class Pomodoro(Static):
-    study_minutes = reactive(25)
-    study_seconds = reactive(0)
-    break_minutes = reactive(5)
-    break_seconds = reactive(0)
-    sessions = reactive(4)
+    # Plain settings; only sessions_remaining is watched
+    study_minutes = 25
+    study_seconds = 0
+    break_minutes = 5
+    break_seconds = 0
+    sessions = 4
 
-    session_type = reactive("study")
+    session_type = "study"
     sessions_remaining = reactive(0)
 
+    _sessions_label = None  # cached in on_mount
+    _label_pending = False
+
     def compose(self) -> ComposeResult:
         with Container(id="main-container"):
             with Container(id="timer-section"):
@@ -97,34 +179,57 @@ class Pomodoro(Static):
                         yield Label("Sessions:")
                         yield Input(value="0", id="sessions-input", classes="time-input")
 
+    def on_mount(self) -> None:
+        # Cache widget lookups so handlers don't walk the DOM on every press
+        self._timer = self.query_one(TimeDisplay)
+        self._sessions_label = self.query_one("#sessions-label", Label)
+        self._inputs = {
+            id: self.query_one(f"#{id}", Input)
+            for id in (
+                "study-min-input",
+                "study-sec-input",
+                "break-min-input",
+                "break-sec-input",
+                "sessions-input",
+            )
+        }
+
     def get_timer(self) -> TimeDisplay:
-        return self.query_one(TimeDisplay)
+        return self._timer
     
     def watch_sessions_remaining(self, sessions: int) -> None:
         """Update the sessions label when sessions_remaining changes."""
         self.update_sessions_label()
     
     def update_sessions_label(self) -> None:
-        """Manually update the sessions label."""
-        try:
-            label = self.query_one("#sessions-label", Label)
-            label.update(f"Sessions Remaining: {self.sessions_remaining}")
-        except:
-            pass 
+        """Schedule a single sessions label update for the next refresh."""
+        if self._label_pending:
+            return
+        self._label_pending = True
+        self.call_after_refresh(self._flush_sessions_label)
+
+    def _flush_sessions_label(self) -> None:
+        self._label_pending = False
+        if self._sessions_label is not None:
+            self._sessions_label.update(f"Sessions Remaining: {self.sessions_remaining}")
 
     @on(Button.Pressed, "#start")
     def start_clicked(self):
-        timer = self.get_timer()
-        # Parse inputs
-        try:
-            self.study_minutes = int(self.query_one("#study-min-input", Input).value or "0")
-            self.study_seconds = int(self.query_one("#study-sec-input", Input).value or "0")
-            self.break_minutes = int(self.query_one("#break-min-input", Input).value or "0")
-            self.break_seconds = int(self.query_one("#break-sec-input", Input).value or "0")
-            self.sessions = int(self.query_one("#sessions-input", Input).value or "1")
-        except ValueError:
-            self.app.bell()
-            return
+        # Parse inputs; validate everything before touching any state
+        values = {}
+        for id, widget in self._inputs.items():
+            value = widget.value or ("1" if id == "sessions-input" else "0")
+            n = _parse_int(value)
+            if n is None:
+                self.app.bell()
+                return
+            values[id] = n
+
+        self.study_minutes = values["study-min-input"]
+        self.study_seconds = values["study-sec-input"]
+        self.break_minutes = values["break-min-input"]
+        self.break_seconds = values["break-sec-input"]
+        self.sessions = values["sessions-input"]
 
         self.sessions_remaining = self.sessions
         self.start_session("study")
@@ -134,15 +239,15 @@ class Pomodoro(Static):
         timer.session_type = session_type
         
         if session_type == "study":
-            timer.limit = (self.study_minutes * 60) + self.study_seconds
+            timer.set_limit((self.study_minutes * 60) + self.study_seconds)
         else:
-            timer.limit = (self.break_minutes * 60) + self.break_seconds
+            timer.set_limit((self.break_minutes * 60) + self.break_seconds)
         
         timer.reset()
         timer.start()
         self.session_type = session_type
         # Update color
-        timer.styles.background = "green" if session_type == "study" else "red"
+        timer.set_session_style(session_type)
 
     @on(Button.Pressed, "#stop")
     def stop_clicked(self):
@@ -153,7 +258,7 @@ class Pomodoro(Static):
         timer = self.get_timer()
         timer.stop()
         self.sessions_remaining = self.sessions
-        timer.styles.background = "transparent"
+        timer.set_session_style(None)
         timer.reset()
 
     @on(SessionEnded)
@@ -167,7 +272,7 @@ class Pomodoro(Static):
             else:
                 timer = self.get_timer()
                 timer.stop()
-                timer.styles.background = "transparent"
+                timer.set_session_style(None)
 
 
 # App